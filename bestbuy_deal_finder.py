@@ -12,35 +12,90 @@ Example:
     python bestbuy_deal_finder.py --html "bestbuy_laptops.html" --ram 16 --storage 1800 --cpu-gen 10
 """
 
+import functools
 import json
+import mmap
+
+try:
+    # ~5-6x faster on the multi-MB __INITIAL_STATE__ blob, and it takes
+    # the raw bytes slice directly. The CLI stays stdlib-only without it.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 import re
 import argparse
 import sys
 from pathlib import Path
 
 
+# All spec formats fused into one alternation (compiled once at import).
+# extract_specs walks the lowercased name in a single finditer pass and
+# keeps the first hit per category, then applies them in the old
+# sequential precedence instead of running ~9 independent searches.
+# The "/16GB/" slash format fed both the RAM and storage pattern lists,
+# so it's a single shared branch with a lookahead for the closing slash.
+_SPECS_RE = re.compile(
+    r'(?P<intel>(?P<intel_family>i\d)-(?P<intel_num>\d{4,5}))'
+    r'|(?P<ultra>(?:core\s+)?ultra\s*(?P<ultra_num>\d+))'
+    r'|(?P<amd>ryzen\s*(?P<amd_series>\d)\s*(?P<amd_num>\d{4}))'
+    r'|(?P<ram_kw>(?P<ram_kw_gb>\d+)\s*gb\s*(?:ddr\d?)?\s*ram)'
+    r'|(?P<ram_ddr>(?P<ram_ddr_gb>\d+)\s*gb\s*ddr\d)'
+    r'|(?P<ssd>(?P<ssd_num>\d+(?:\.\d+)?)\s*(?P<ssd_unit>tb|gb)\s*ssd)'
+    r'|(?P<nvme>(?P<nvme_num>\d+(?:\.\d+)?)\s*(?P<nvme_unit>tb|gb)\s*(?:nvme|pcie))'
+    r'|(?P<slash>/\s*(?P<slash_num>\d+(?:\.\d+)?)\s*(?P<slash_unit>tb|gb)\s*(?=/))'
+    r'|(?P<gpu>rtx\s*\d{4}(?:\s*ti)?|gtx\s*\d{4})'
+)
+_SPECS_GROUPS = ('intel', 'ultra', 'amd', 'ram_kw', 'ram_ddr',
+                 'ssd', 'nvme', 'slash', 'gpu')
+# Pattern-priority replay order for the storage branches
+_STORAGE_ORDER = (('ssd', 'ssd_num', 'ssd_unit'), ('nvme', 'nvme_num', 'nvme_unit'),
+                  ('slash', 'slash_num', 'slash_unit'))
+
+
 def parse_size(size_str):
-    """Parse storage/RAM strings like '16GB', '1TB', '512GB' into GB as integer."""
+    """Parse storage/RAM strings like '16GB', '1TB', '512GB' into GB as integer.
+
+    Plain digit scan — these strings are tiny and regular, so there's no
+    need to enter the regex engine per call.
+    """
     if not size_str:
         return 0
-    size_str = str(size_str).upper().replace(" ", "")
-
+    s = str(size_str).upper().replace(" ", "")
+    i = 0
+    end = len(s)
+    while i < end and (s[i].isdigit() or s[i] == '.'):
+        i += 1
+    if i == 0:
+        return 0
     try:
-        if "TB" in size_str:
-            match = re.search(r'(\d+(?:\.\d+)?)', size_str)
-            if match:
-                return int(float(match.group(1)) * 1024)
-        if "GB" in size_str:
-            match = re.search(r'(\d+(?:\.\d+)?)', size_str)
-            if match:
-                return int(float(match.group(1)))
-    except (ValueError, AttributeError):
-        pass
+        value = float(s[:i])
+    except ValueError:
+        return 0
+    unit = s[i:]
+    if "TB" in unit:
+        return int(value * 1024)
+    if "GB" in unit:
+        return int(value)
     return 0
 
 
+def _size_gb(num, unit):
+    """GB from already-matched (number, unit) regex groups."""
+    return int(float(num) * (1024 if unit[0] in 'tT' else 1))
+
+
 def extract_specs(name):
-    """Extract CPU, RAM, Storage, and GPU specs from a product name string."""
+    """Extract CPU, RAM, Storage, and GPU specs from a product name string.
+
+    Memoized per name: Best Buy repeats the same configuration across
+    color/warranty SKUs, so duplicates skip the regex work. Callers get
+    a copy so cached entries can't be mutated.
+    """
+    return _extract_specs_cached(name).copy()
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_specs_cached(name):
     specs = {
         'cpu_gen': 0,
         'cpu_model': 'Unknown',
@@ -49,11 +104,21 @@ def extract_specs(name):
         'gpu': 'Integrated'
     }
 
+    name_lower = name.lower()
+    hits = {}
+    for m in _SPECS_RE.finditer(name_lower):
+        for group in _SPECS_GROUPS:
+            if group not in hits and m.group(group) is not None:
+                hits[group] = m
+                break
+        if len(hits) == len(_SPECS_GROUPS):
+            break
+
     # Intel Core iX-XXXXX (e.g., i7-13620H, i5-12450H)
-    intel_match = re.search(r'(i\d)-(\d{4,5})', name)
+    intel_match = hits.get('intel')
     if intel_match:
-        specs['cpu_model'] = f"{intel_match.group(1)}-{intel_match.group(2)}"
-        model_num = intel_match.group(2)
+        model_num = intel_match.group('intel_num')
+        specs['cpu_model'] = f"{intel_match.group('intel_family')}-{model_num}"
         # Generation is first 1-2 digits (12th gen = 12xxx, 13th gen = 13xxx)
         if len(model_num) == 5:
             specs['cpu_gen'] = int(model_num[:2])
@@ -61,73 +126,114 @@ def extract_specs(name):
             specs['cpu_gen'] = int(model_num[0])
 
     # Intel Core Ultra (newer chips, treat as gen 14+)
-    ultra_match = re.search(r'(?:Core\s+)?Ultra\s*(\d+)', name, re.IGNORECASE)
+    ultra_match = hits.get('ultra')
     if ultra_match:
         specs['cpu_gen'] = 14  # Ultra series is newer than 13th gen
-        specs['cpu_model'] = f"Ultra {ultra_match.group(1)}"
+        specs['cpu_model'] = f"Ultra {ultra_match.group('ultra_num')}"
 
     # AMD Ryzen (e.g., Ryzen 7 7840HS)
-    amd_match = re.search(r'Ryzen\s*(\d)\s*(\d{4})', name, re.IGNORECASE)
+    amd_match = hits.get('amd')
     if amd_match:
-        specs['cpu_model'] = f"Ryzen {amd_match.group(1)} {amd_match.group(2)}"
+        specs['cpu_model'] = f"Ryzen {amd_match.group('amd_series')} {amd_match.group('amd_num')}"
         # Ryzen 7xxx series is comparable to Intel 13th gen
-        series = int(amd_match.group(2)[0])
+        series = int(amd_match.group('amd_num')[0])
         specs['cpu_gen'] = series + 6  # Rough equivalence (7xxx ~ gen 13)
 
-    # RAM - look for patterns like "16GB RAM" or "16GB DDR5"
-    ram_patterns = [
-        r'(\d+)\s*GB\s*(?:DDR\d?)?\s*RAM',
-        r'(\d+)\s*GB\s*DDR\d',
-        r'/\s*(\d+)\s*GB\s*/',  # "/16GB/" format
-    ]
-    for pattern in ram_patterns:
-        ram_match = re.search(pattern, name, re.IGNORECASE)
-        if ram_match:
-            specs['ram'] = int(ram_match.group(1))
-            break
+    # RAM - keyword/DDR branches first, then the "/16GB/" slash format
+    ram_match = hits.get('ram_kw') or hits.get('ram_ddr')
+    if ram_match:
+        gb_group = 'ram_kw_gb' if ram_match.group('ram_kw') else 'ram_ddr_gb'
+        specs['ram'] = int(ram_match.group(gb_group))
+    else:
+        slash_match = hits.get('slash')
+        if slash_match and slash_match.group('slash_unit') == 'gb' \
+                and '.' not in slash_match.group('slash_num'):
+            specs['ram'] = int(slash_match.group('slash_num'))
 
     # Storage - look for SSD sizes
-    storage_patterns = [
-        r'(\d+(?:\.\d+)?)\s*(TB|GB)\s*SSD',
-        r'(\d+(?:\.\d+)?)\s*(TB|GB)\s*(?:NVMe|PCIe)',
-        r'/\s*(\d+(?:\.\d+)?)\s*(TB|GB)\s*/',
-    ]
-    for pattern in storage_patterns:
-        storage_match = re.search(pattern, name, re.IGNORECASE)
+    for group, num_group, unit_group in _STORAGE_ORDER:
+        storage_match = hits.get(group)
         if storage_match:
-            specs['storage'] = parse_size(f"{storage_match.group(1)}{storage_match.group(2)}")
+            specs['storage'] = _size_gb(storage_match.group(num_group), storage_match.group(unit_group))
             break
 
     # GPU - NVIDIA RTX/GTX
-    gpu_match = re.search(r'(RTX\s*\d{4}(?:\s*Ti)?|GTX\s*\d{4})', name, re.IGNORECASE)
+    gpu_match = hits.get('gpu')
     if gpu_match:
-        specs['gpu'] = gpu_match.group(1).upper().replace(" ", " ")
+        specs['gpu'] = gpu_match.group('gpu').upper()
 
     return specs
 
 
+def _find_initial_state_json(content):
+    """Locate the balanced `window.__INITIAL_STATE__ = {...}` JSON slice.
+
+    A hand-rolled brace counter (string- and escape-aware) instead of a
+    lazy `.*?` regex with re.DOTALL, which scans megabytes of HTML one
+    speculative expansion at a time. Works on any bytes-like buffer
+    (bytes or an mmap), so the page never needs decoding.
+    """
+    idx = content.find(b'window.__INITIAL_STATE__')
+    if idx == -1:
+        return None
+    start = content.find(b'{', idx)
+    if start == -1:
+        return None
+
+    quote, backslash = ord('"'), ord('\\')
+    open_brace, close_brace = ord('{'), ord('}')
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(content)):
+        byte = content[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif byte == backslash:
+                escaped = True
+            elif byte == quote:
+                in_string = False
+        elif byte == quote:
+            in_string = True
+        elif byte == open_brace:
+            depth += 1
+        elif byte == close_brace:
+            depth -= 1
+            if depth == 0:
+                return content[start:i + 1]
+    return None
+
+
 def extract_products_from_html(file_path):
-    """Extract product data from Best Buy Canada's saved HTML page."""
+    """Extract product data from Best Buy Canada's saved HTML page.
+
+    Memory-maps the file so the OS page cache is the buffer — no full
+    f.read() copy of the multi-MB page, and no up-front decode; only
+    the extracted JSON slice is materialized for json.loads.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            try:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty file or platform without mmap support
+                content = f.read()
     except FileNotFoundError:
         print(f"Error: File not found: {file_path}")
         sys.exit(1)
-    except UnicodeDecodeError:
-        # Try with different encoding
-        with open(file_path, 'r', encoding='latin-1') as f:
-            content = f.read()
 
     # Look for the embedded JSON data
-    match = re.search(r'window\.__INITIAL_STATE__\s*=\s*({.*?});', content, re.DOTALL)
-    if not match:
+    json_bytes = _find_initial_state_json(content)
+    if isinstance(content, mmap.mmap):
+        content.close()
+    if not json_bytes:
         print("Error: Could not find product data in HTML file.")
         print("Make sure you saved the page using 'Save Page As' (Ctrl+S / Cmd+S)")
         sys.exit(1)
 
     try:
-        data = json.loads(match.group(1))
+        data = _json_loads(json_bytes)
     except json.JSONDecodeError as e:
         print(f"Error: Failed to parse product data: {e}")
         sys.exit(1)
@@ -193,16 +299,8 @@ def analyze_deals(products, current_specs, show_all=False):
         elif specs['storage'] > 0 and specs['storage'] < current_specs['storage']:
             notes.append(f"Storage- ({specs['storage']}GB)")
 
-        # Calculate upgrade score
-        score = 0
-        if better_cpu:
-            score += 2
-        if better_ram:
-            score += 2
-        if better_storage:
-            score += 1
-        if saving > 0:
-            score += 1
+        # Calculate upgrade score; bools are 0/1, so it's plain arithmetic
+        score = (better_cpu + better_ram) * 2 + better_storage + (saving > 0)
 
         deal = {
             'name': name,
@@ -264,42 +362,9 @@ def print_deals_table(deals, current_specs):
         print(f"{'*'*60}")
 
 
-def generate_wishlist_html(deals, output_path="wishlist.html", top_n=3):
-    """Generate a nice HTML wishlist page with top deals."""
-    top_deals = deals[:top_n]
-
-    items_html = ""
-    for i, deal in enumerate(top_deals, 1):
-        savings_html = ""
-        if deal['saving'] > 0:
-            savings_html = f'<div class="savings">Save ${deal["saving"]:.0f}!</div>'
-
-        specs_html = ""
-        if deal['specs']['cpu_gen'] > 0:
-            specs_html += f"<li><strong>CPU:</strong> {deal['specs']['cpu_model']} (Gen {deal['specs']['cpu_gen']})</li>\n"
-        if deal['specs']['ram'] > 0:
-            specs_html += f"<li><strong>RAM:</strong> {deal['specs']['ram']}GB</li>\n"
-        if deal['specs']['storage'] > 0:
-            specs_html += f"<li><strong>Storage:</strong> {deal['specs']['storage']}GB SSD</li>\n"
-        if deal['specs']['gpu'] != 'Integrated':
-            specs_html += f"<li><strong>GPU:</strong> {deal['specs']['gpu']}</li>\n"
-
-        notes_text = ", ".join(deal['notes']) if deal['notes'] else "Good value"
-
-        items_html += f'''
-    <div class="item">
-        <h2>{i}. {deal['name'][:60]}{'...' if len(deal['name']) > 60 else ''}</h2>
-        <ul class="specs">
-            {specs_html}
-        </ul>
-        <div class="price-tag">${deal['price']:,.2f}</div>
-        {savings_html}
-        <p class="upgrade-notes">Upgrades: {notes_text}</p>
-        <a href="{deal['url']}" class="btn" target="_blank">View Product</a>
-    </div>
-'''
-
-    html_content = f'''<!DOCTYPE html>
+# Static wishlist page template; only {top_n} and {items_html} vary
+# per run, so the CSS/markup is built once at import time.
+_WISHLIST_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -424,6 +489,49 @@ def generate_wishlist_html(deals, output_path="wishlist.html", top_n=3):
 </html>
 '''
 
+
+def generate_wishlist_html(deals, output_path="wishlist.html", top_n=3):
+    """Generate a nice HTML wishlist page with top deals."""
+    top_deals = deals[:top_n]
+
+    # Collect fragments and join once — repeated += on strings copies
+    # the accumulated HTML on every iteration
+    items = []
+    for i, deal in enumerate(top_deals, 1):
+        savings_html = ""
+        if deal['saving'] > 0:
+            savings_html = f'<div class="savings">Save ${deal["saving"]:.0f}!</div>'
+
+        spec_lines = []
+        if deal['specs']['cpu_gen'] > 0:
+            spec_lines.append(f"<li><strong>CPU:</strong> {deal['specs']['cpu_model']} (Gen {deal['specs']['cpu_gen']})</li>\n")
+        if deal['specs']['ram'] > 0:
+            spec_lines.append(f"<li><strong>RAM:</strong> {deal['specs']['ram']}GB</li>\n")
+        if deal['specs']['storage'] > 0:
+            spec_lines.append(f"<li><strong>Storage:</strong> {deal['specs']['storage']}GB SSD</li>\n")
+        if deal['specs']['gpu'] != 'Integrated':
+            spec_lines.append(f"<li><strong>GPU:</strong> {deal['specs']['gpu']}</li>\n")
+        specs_html = "".join(spec_lines)
+
+        notes_text = ", ".join(deal['notes']) if deal['notes'] else "Good value"
+        name = deal['name']
+        title = (name[:60] + '...') if len(name) > 60 else name
+
+        items.append(f'''
+    <div class="item">
+        <h2>{i}. {title}</h2>
+        <ul class="specs">
+            {specs_html}
+        </ul>
+        <div class="price-tag">${deal['price']:,.2f}</div>
+        {savings_html}
+        <p class="upgrade-notes">Upgrades: {notes_text}</p>
+        <a href="{deal['url']}" class="btn" target="_blank">View Product</a>
+    </div>
+''')
+
+    html_content = _WISHLIST_TEMPLATE.format(top_n=top_n, items_html="".join(items))
+
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(html_content)
 
@@ -19,141 +19,311 @@ Examples:
 License: AGPL-3.0 - Contributions welcome! See CONTRIBUTING.md for details.
 """
 
+import bisect
+import functools
 import html as html_module
 import json
+import mmap
+
+try:
+    # ~5-6x faster on the multi-MB __INITIAL_STATE__ blob, and it takes
+    # the raw bytes slice directly. The CLI stays stdlib-only without it.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 import re
 import argparse
 import sys
 from pathlib import Path
 
 
+# All spec formats fused into one alternation (compiled once at import).
+# extract_specs walks the lowercased name in a single finditer pass and
+# keeps the first hit per category, then applies them in the old
+# sequential precedence instead of running ~10 independent searches.
+_SPECS_RE = re.compile(
+    r'(?P<intel>(?P<intel_family>i\d)-(?P<intel_num>\d{4,5}))'
+    r'|(?P<ultra>(?:core\s+)?ultra\s*(?P<ultra_num>\d+))'
+    r'|(?P<amd>ryzen\s*(?:ai\s*)?(?P<amd_series>\d)\s*(?P<amd_num>\d{3,4}))'
+    r'|(?P<snap>snapdragon\s*x\s*(?P<snap_model>plus|elite)?)'
+    r'|(?P<ram_kw>(?P<ram_kw_gb>\d+)\s*gb\s*(?:lp)?ddr\d?\s*ram)'
+    r'|(?P<ram_ddr>(?P<ram_ddr_gb>\d+)\s*gb\s*(?:lp)?ddr\d)'
+    r'|(?P<ram_plain>(?P<ram_plain_gb>\d+)\s*gb\s+ram)'
+    r'|(?P<ram_comma>,\s*(?P<ram_comma_gb>\d+)\s*gb\s+ram)'
+    r'|(?P<ssd>(?P<ssd_num>\d+(?:\.\d+)?)\s*(?P<ssd_unit>tb|gb)\s*ssd)'
+    r'|(?P<nvme>(?P<nvme_num>\d+(?:\.\d+)?)\s*(?P<nvme_unit>tb|gb)\s*(?:nvme|pcie))'
+    r'|(?P<gpu>rtx\s*\d{4}(?:\s*ti)?|gtx\s*\d{4})'
+)
+_SPECS_GROUPS = ('intel', 'ultra', 'amd', 'snap', 'ram_kw', 'ram_ddr',
+                 'ram_plain', 'ram_comma', 'ssd', 'nvme', 'gpu')
+# Pattern-priority replay orders for the multi-branch categories
+_RAM_ORDER = (('ram_kw', 'ram_kw_gb'), ('ram_ddr', 'ram_ddr_gb'),
+              ('ram_plain', 'ram_plain_gb'), ('ram_comma', 'ram_comma_gb'))
+_STORAGE_ORDER = (('ssd', 'ssd_num', 'ssd_unit'), ('nvme', 'nvme_num', 'nvme_unit'))
+
+
 def parse_size(size_str):
-    """Parse storage/RAM strings like '16GB', '1TB', '512GB' into GB as integer."""
+    """Parse storage/RAM strings like '16GB', '1TB', '512GB' into GB as integer.
+
+    Plain digit scan — these strings are tiny and regular, so there's no
+    need to enter the regex engine per call.
+    """
     if not size_str:
         return 0
-    size_str = str(size_str).upper().replace(" ", "")
+    s = str(size_str).upper().replace(" ", "")
+    i = 0
+    end = len(s)
+    while i < end and (s[i].isdigit() or s[i] == '.'):
+        i += 1
+    if i == 0:
+        return 0
     try:
-        if "TB" in size_str:
-            match = re.search(r'(\d+(?:\.\d+)?)', size_str)
-            if match:
-                return int(float(match.group(1)) * 1024)
-        if "GB" in size_str:
-            match = re.search(r'(\d+(?:\.\d+)?)', size_str)
-            if match:
-                return int(float(match.group(1)))
-    except (ValueError, AttributeError):
-        pass
+        value = float(s[:i])
+    except ValueError:
+        return 0
+    unit = s[i:]
+    if "TB" in unit:
+        return int(value * 1024)
+    if "GB" in unit:
+        return int(value)
     return 0
 
 
+def _size_gb(num, unit):
+    """GB from already-matched (number, unit) regex groups."""
+    return int(float(num) * (1024 if unit[0] in 'tT' else 1))
+
+
 def extract_specs(name):
-    """Extract CPU, RAM, Storage, and GPU specs from a product name string."""
+    """Extract CPU, RAM, Storage, and GPU specs from a product name string.
+
+    Memoized per name: retailers repeat the same configuration across
+    color/warranty SKUs, so duplicates skip the regex work. Callers get
+    a copy so cached entries can't be mutated.
+    """
+    return _extract_specs_cached(name).copy()
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_specs_cached(name):
     specs = {'cpu_gen': 0, 'cpu_model': 'Unknown', 'ram': 0, 'storage': 0, 'gpu': 'Integrated'}
 
+    name_lower = name.lower()
+    hits = {}
+    for m in _SPECS_RE.finditer(name_lower):
+        for group in _SPECS_GROUPS:
+            if group not in hits and m.group(group) is not None:
+                hits[group] = m
+                break
+        if len(hits) == len(_SPECS_GROUPS):
+            break
+
     # Intel Core iX-XXXXX
-    intel_match = re.search(r'(i\d)-(\d{4,5})', name)
+    intel_match = hits.get('intel')
     if intel_match:
-        specs['cpu_model'] = f"{intel_match.group(1)}-{intel_match.group(2)}"
-        model_num = intel_match.group(2)
+        model_num = intel_match.group('intel_num')
+        specs['cpu_model'] = f"{intel_match.group('intel_family')}-{model_num}"
         specs['cpu_gen'] = int(model_num[:2]) if len(model_num) == 5 else int(model_num[0])
 
     # Intel Core Ultra
-    ultra_match = re.search(r'(?:Core\s+)?Ultra\s*(\d+)', name, re.IGNORECASE)
+    ultra_match = hits.get('ultra')
     if ultra_match:
         specs['cpu_gen'] = 14
-        specs['cpu_model'] = f"Ultra {ultra_match.group(1)}"
+        specs['cpu_model'] = f"Ultra {ultra_match.group('ultra_num')}"
 
     # AMD Ryzen (including AI variants)
-    amd_match = re.search(r'Ryzen\s*(?:AI\s*)?(\d)\s*(\d{3,4})', name, re.IGNORECASE)
+    amd_match = hits.get('amd')
     if amd_match:
-        specs['cpu_model'] = f"Ryzen {amd_match.group(1)} {amd_match.group(2)}"
-        specs['cpu_gen'] = int(amd_match.group(2)[0]) + 6
+        specs['cpu_model'] = f"Ryzen {amd_match.group('amd_series')} {amd_match.group('amd_num')}"
+        specs['cpu_gen'] = int(amd_match.group('amd_num')[0]) + 6
 
     # Qualcomm Snapdragon X
-    snapdragon_match = re.search(r'Snapdragon\s*X\s*(Plus|Elite)?', name, re.IGNORECASE)
+    snapdragon_match = hits.get('snap')
     if snapdragon_match:
         specs['cpu_gen'] = 14
-        specs['cpu_model'] = f"Snapdragon X {snapdragon_match.group(1) or ''}".strip()
+        if snapdragon_match.group('snap_model'):
+            # Slice the original name so Plus/Elite keeps its casing
+            model = name[snapdragon_match.start('snap_model'):snapdragon_match.end('snap_model')]
+            specs['cpu_model'] = f"Snapdragon X {model}"
+        else:
+            specs['cpu_model'] = "Snapdragon X"
 
-    # RAM patterns
-    for pattern in [r'(\d+)\s*GB\s*(?:LP)?DDR\d?\s*RAM', r'(\d+)\s*GB\s*(?:LP)?DDR\d',
-                    r'(\d+)\s*GB\s+RAM', r',\s*(\d+)\s*GB\s+RAM']:
-        ram_match = re.search(pattern, name, re.IGNORECASE)
+    # RAM — first branch (in old pattern order) that hit
+    for group, gb_group in _RAM_ORDER:
+        ram_match = hits.get(group)
         if ram_match:
-            specs['ram'] = int(ram_match.group(1))
+            specs['ram'] = int(ram_match.group(gb_group))
             break
 
-    # Storage patterns
-    for pattern in [r'(\d+(?:\.\d+)?)\s*(TB|GB)\s*SSD', r'(\d+(?:\.\d+)?)\s*(TB|GB)\s*(?:NVMe|PCIe)']:
-        storage_match = re.search(pattern, name, re.IGNORECASE)
+    # Storage — same replay
+    for group, num_group, unit_group in _STORAGE_ORDER:
+        storage_match = hits.get(group)
         if storage_match:
-            specs['storage'] = parse_size(f"{storage_match.group(1)}{storage_match.group(2)}")
+            specs['storage'] = _size_gb(storage_match.group(num_group), storage_match.group(unit_group))
             break
 
     # GPU
-    gpu_match = re.search(r'(RTX\s*\d{4}(?:\s*Ti)?|GTX\s*\d{4})', name, re.IGNORECASE)
+    gpu_match = hits.get('gpu')
     if gpu_match:
-        specs['gpu'] = gpu_match.group(1).upper()
+        specs['gpu'] = gpu_match.group('gpu').upper()
 
     return specs
 
 
-def detect_source(content):
-    """Detect whether the HTML is from Best Buy or Amazon."""
-    if 'amazon.ca' in content.lower() or 'amazon.com' in content.lower() or 'data-asin=' in content:
+_AMAZON_MARKER_RE = re.compile(rb'amazon\.ca|amazon\.com', re.IGNORECASE)
+_BESTBUY_MARKER_RE = re.compile(rb'bestbuy\.ca', re.IGNORECASE)
+
+
+def _detect_source_in(buf):
+    if _AMAZON_MARKER_RE.search(buf) or buf.find(b'data-asin=') != -1:
         return 'amazon'
-    elif 'bestbuy.ca' in content.lower() or '__INITIAL_STATE__' in content:
+    elif _BESTBUY_MARKER_RE.search(buf) or buf.find(b'__INITIAL_STATE__') != -1:
         return 'bestbuy'
     return 'unknown'
 
 
+def detect_source(content):
+    """Detect whether the HTML is from Best Buy or Amazon.
+
+    Case-insensitive regex searches on the raw buffer — no .lower()
+    copy of the whole multi-MB page per marker check. The markers
+    normally sit in the first few KB (head links, scripts), so sniff a
+    128 KB head slice first and only scan the full page if that slice
+    is inconclusive.
+    """
+    source = _detect_source_in(content[:131072])
+    if source == 'unknown' and len(content) > 131072:
+        source = _detect_source_in(content)
+    return source
+
+
+# Amazon search-result patterns, each scanned once over the full page.
+# Products are reassembled by match position instead of running an
+# interpolated per-ASIN regex from the top of the document for every hit.
+# Quantifiers are explicitly bounded ({0,500} attribute runs, {1,1000}
+# labels) so malformed markup degrades to a failed match instead of a
+# long scan. Bytes patterns: they run directly against the mmap'd file,
+# so the page is never decoded — only the captured groups are.
+_ASIN_ANCHOR_RE = re.compile(rb'data-asin="([A-Z0-9]{10})"[^>]{0,500}data-component-type="s-search-result"', re.IGNORECASE)
+_H2_NAME_RE = re.compile(rb'<h2[^>]{0,500}aria-label="([^"]{1,1000})"[^>]{0,500}>', re.IGNORECASE)
+_OFFSCREEN_PRICE_RE = re.compile(rb'<span class="a-offscreen">([^<]{1,100})</span>', re.IGNORECASE)
+_WAS_RE = re.compile(rb'Was:')
+_PRICE_NUM_RE = re.compile(r'\$?([\d,]+(?:\.\d{2})?)', re.ASCII)
+
+
+def _decode(raw):
+    """Decode a captured byte slice (UTF-8 pages with a latin-1 fallback)."""
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw.decode('latin-1')
+
+
+def _parse_price(price_str):
+    """Parse '$1,299.99' style strings into a float (0 on failure)."""
+    price_match = _PRICE_NUM_RE.search(price_str)
+    return float(price_match.group(1).replace(',', '')) if price_match else 0
+
+
 def extract_products_from_amazon_html(content):
-    """Extract product data from Amazon.ca saved HTML page."""
+    """Extract product data from Amazon.ca saved HTML page.
+
+    Scans the page once per pattern (result anchors, names, prices,
+    "Was:" markers) and joins the matches by position, bounding each
+    lookup to its own result block. The old code re-searched the whole
+    page with a freshly interpolated per-ASIN regex for every product —
+    O(products x page size) on multi-MB saved pages.
+    """
     products = []
     seen_asins = set()
 
-    asin_pattern = re.compile(r'data-asin="([A-Z0-9]{10})"[^>]*data-component-type="s-search-result"', re.IGNORECASE)
-    asins = asin_pattern.findall(content)
+    anchors = [(m.start(), m.group(1).decode('ascii')) for m in _ASIN_ANCHOR_RE.finditer(content)]
+    names = [(m.start(), m.group(1)) for m in _H2_NAME_RE.finditer(content)]
+    prices = [(m.start(), m.group(1)) for m in _OFFSCREEN_PRICE_RE.finditer(content)]
+    was_marks = [m.start() for m in _WAS_RE.finditer(content)]
+    name_positions = [pos for pos, _ in names]
+    price_positions = [pos for pos, _ in prices]
 
-    for asin in asins:
+    for i, (start, asin) in enumerate(anchors):
         if asin in seen_asins or not asin:
             continue
         seen_asins.add(asin)
+        block_end = anchors[i + 1][0] if i + 1 < len(anchors) else len(content)
+
+        # First product name in this result block
+        n = bisect.bisect_right(name_positions, start)
+        if n >= len(names) or names[n][0] >= block_end:
+            continue
+        name_pos, raw_name = names[n]
+        name = html_module.unescape(_decode(raw_name))
 
-        block_pattern = re.compile(
-            rf'data-asin="{asin}".*?<h2[^>]*aria-label="([^"]+)"[^>]*>.*?<span class="a-offscreen">([^<]+)</span>',
-            re.DOTALL | re.IGNORECASE
-        )
-        match = block_pattern.search(content)
-        if match:
-            name = html_module.unescape(match.group(1))
-            price_str = match.group(2)
-            price_match = re.search(r'\$?([\d,]+(?:\.\d{2})?)', price_str)
-            price = float(price_match.group(1).replace(',', '')) if price_match else 0
-
-            # Check for original price
-            was_pattern = re.compile(rf'data-asin="{asin}".*?Was:.*?<span class="a-offscreen">([^<]+)</span>', re.DOTALL | re.IGNORECASE)
-            was_match = was_pattern.search(content)
-            original_price = 0
-            if was_match:
-                orig_match = re.search(r'\$?([\d,]+(?:\.\d{2})?)', was_match.group(1))
-                if orig_match:
-                    original_price = float(orig_match.group(1).replace(',', ''))
-
-            products.append({
-                'name': name, 'price': price, 'saving': max(0, original_price - price),
-                'sku': asin, 'asin': asin, 'url': f"https://www.amazon.ca/dp/{asin}", 'source': 'amazon'
-            })
+        # First price after the name, still within the block
+        p = bisect.bisect_right(price_positions, name_pos)
+        if p >= len(prices) or prices[p][0] >= block_end:
+            continue
+        price = _parse_price(_decode(prices[p][1]))
+
+        # Check for original price ("Was: $X" within the same block)
+        original_price = 0
+        w = bisect.bisect_right(was_marks, start)
+        if w < len(was_marks) and was_marks[w] < block_end:
+            o = bisect.bisect_right(price_positions, was_marks[w])
+            if o < len(prices) and prices[o][0] < block_end:
+                original_price = _parse_price(_decode(prices[o][1]))
+
+        products.append({
+            'name': name, 'price': price, 'saving': max(0, original_price - price),
+            'sku': asin, 'asin': asin, 'url': f"https://www.amazon.ca/dp/{asin}", 'source': 'amazon'
+        })
     return products
 
 
+def _find_initial_state_json(content):
+    """Locate the balanced `window.__INITIAL_STATE__ = {...}` JSON slice.
+
+    Brace-counting scan (string- and escape-aware) — avoids a lazy `.*?`
+    regex with re.DOTALL over the whole multi-MB page. Works on any
+    bytes-like buffer (bytes or an mmap), so the page is never decoded.
+    """
+    idx = content.find(b'window.__INITIAL_STATE__')
+    if idx == -1:
+        return None
+    start = content.find(b'{', idx)
+    if start == -1:
+        return None
+
+    quote, backslash = ord('"'), ord('\\')
+    open_brace, close_brace = ord('{'), ord('}')
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(content)):
+        byte = content[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif byte == backslash:
+                escaped = True
+            elif byte == quote:
+                in_string = False
+        elif byte == quote:
+            in_string = True
+        elif byte == open_brace:
+            depth += 1
+        elif byte == close_brace:
+            depth -= 1
+            if depth == 0:
+                return content[start:i + 1]
+    return None
+
+
 def extract_products_from_bestbuy_html(content):
     """Extract product data from Best Buy Canada's saved HTML page."""
-    match = re.search(r'window\.__INITIAL_STATE__\s*=\s*({.*?});', content, re.DOTALL)
-    if not match:
+    json_str = _find_initial_state_json(content)
+    if not json_str:
         return None
     try:
-        data = json.loads(match.group(1))
+        data = _json_loads(json_str)
     except json.JSONDecodeError:
         return None
 
@@ -175,35 +345,46 @@ def extract_products_from_bestbuy_html(content):
 
 
 def extract_products_from_html(file_path):
-    """Extract product data from saved HTML page (auto-detects source)."""
+    """Extract product data from saved HTML page (auto-detects source).
+
+    Memory-maps the file so the OS page cache is the buffer — no full
+    f.read() copy of the multi-MB page and no up-front decode. The
+    bytes patterns match the ASCII markup directly; only captured
+    groups and the extracted JSON slice are ever decoded.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            try:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty file or platform without mmap support
+                content = f.read()
     except FileNotFoundError:
         print(f"Error: File not found: {file_path}")
         sys.exit(1)
-    except UnicodeDecodeError:
-        with open(file_path, 'r', encoding='latin-1') as f:
-            content = f.read()
 
-    source = detect_source(content)
-    print(f"Detected source: {source.upper()}")
+    try:
+        source = detect_source(content)
+        print(f"Detected source: {source.upper()}")
 
-    if source == 'amazon':
-        products = extract_products_from_amazon_html(content)
-        if not products:
-            print("Error: No products found in Amazon HTML. Save search results page as HTML only.")
-            sys.exit(1)
-        return products
-    elif source == 'bestbuy':
-        products = extract_products_from_bestbuy_html(content)
-        if not products:
-            print("Error: Could not find product data in Best Buy HTML.")
+        if source == 'amazon':
+            products = extract_products_from_amazon_html(content)
+            if not products:
+                print("Error: No products found in Amazon HTML. Save search results page as HTML only.")
+                sys.exit(1)
+            return products
+        elif source == 'bestbuy':
+            products = extract_products_from_bestbuy_html(content)
+            if not products:
+                print("Error: Could not find product data in Best Buy HTML.")
+                sys.exit(1)
+            return products
+        else:
+            print("Error: Could not detect source (Best Buy or Amazon).")
             sys.exit(1)
-        return products
-    else:
-        print("Error: Could not detect source (Best Buy or Amazon).")
-        sys.exit(1)
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
 
 
 def analyze_deals(products, current_specs, show_all=False):
@@ -233,7 +414,8 @@ def analyze_deals(products, current_specs, show_all=False):
         elif specs['storage'] > 0 and specs['storage'] < current_specs['storage']:
             notes.append(f"Storage- ({specs['storage']}GB)")
 
-        score = (2 if better_cpu else 0) + (2 if better_ram else 0) + (1 if better_storage else 0) + (1 if saving > 0 else 0)
+        # bools are 0/1, so the score is plain arithmetic — no branches
+        score = (better_cpu + better_ram) * 2 + better_storage + (saving > 0)
 
         deal = {
             'name': name, 'name_short': (name[:55] + "...") if len(name) > 55 else name,
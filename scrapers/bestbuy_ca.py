@@ -21,6 +21,28 @@ API_HEADERS = {
     "Referer": "https://www.bestbuy.ca/en-ca/search",
 }
 
+# One impersonating session per process, created on first use so the
+# module still imports without curl_cffi. Reusing it keeps the TLS
+# connection to bestbuy.ca alive across searches instead of
+# re-handshaking per call.
+_session = None
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        from curl_cffi import requests as cffi_requests
+        _session = cffi_requests.Session(impersonate="chrome")
+    return _session
+
+
+# Compiled once at import; _enrich_ram_specs_from_description runs per product.
+_DESC_CL_RE = re.compile(r"CL(\d+)", re.IGNORECASE)
+_DESC_VOLT_RE = re.compile(r"(\d+\.\d+)\s*V")
+_DESC_KIT_RE = re.compile(r"(\d+)\s*x\s*(\d+)\s*GB", re.IGNORECASE)
+_DESC_SPEED_RE = re.compile(r"(\d{4,5})\s*MHz")
+_DESC_DDR_RE = re.compile(r"(DDR[45])", re.IGNORECASE)
+
 
 def search_products(query, category=None, max_results=48, page=1, sort_by="relevance"):
     """Search Best Buy Canada's API directly.
@@ -36,7 +58,7 @@ def search_products(query, category=None, max_results=48, page=1, sort_by="relev
         (products_list, error_string_or_None)
     """
     try:
-        from curl_cffi import requests as cffi_requests
+        session = _get_session()
     except ImportError:
         return None, "Best Buy Canada scraper requires curl_cffi. Install with: pip install curl_cffi"
 
@@ -51,11 +73,10 @@ def search_products(query, category=None, max_results=48, page=1, sort_by="relev
     }
 
     try:
-        response = cffi_requests.get(
+        response = session.get(
             BESTBUY_API_URL,
             params=params,
             headers=API_HEADERS,
-            impersonate="chrome",
             timeout=15,
         )
         response.raise_for_status()
@@ -160,19 +181,19 @@ def _enrich_ram_specs_from_description(specs, description):
             specs["form_factor"] = "DIMM"
 
     if specs.get("cas_latency", 0) == 0:
-        cl_match = re.search(r"CL(\d+)", description, re.IGNORECASE)
+        cl_match = _DESC_CL_RE.search(description)
         if cl_match:
             specs["cas_latency"] = int(cl_match.group(1))
 
     if specs.get("voltage", 0) == 0:
-        volt_match = re.search(r"(\d+\.\d+)\s*V", description)
+        volt_match = _DESC_VOLT_RE.search(description)
         if volt_match:
             v = float(volt_match.group(1))
             if 0.9 <= v <= 1.6:
                 specs["voltage"] = v
 
     if not specs.get("kit_config"):
-        kit_match = re.search(r"(\d+)\s*x\s*(\d+)\s*GB", description, re.IGNORECASE)
+        kit_match = _DESC_KIT_RE.search(description)
         if kit_match:
             stick_count = int(kit_match.group(1))
             per_stick = int(kit_match.group(2))
@@ -182,12 +203,12 @@ def _enrich_ram_specs_from_description(specs, description):
             specs["ram"] = stick_count * per_stick
 
     if specs.get("ram_speed_mhz", 0) == 0:
-        speed_match = re.search(r"(\d{4,5})\s*MHz", description)
+        speed_match = _DESC_SPEED_RE.search(description)
         if speed_match:
             specs["ram_speed_mhz"] = int(speed_match.group(1))
 
     if specs.get("ram_type", "Unknown") == "Unknown":
-        ddr_match = re.search(r"(DDR[45])", description, re.IGNORECASE)
+        ddr_match = _DESC_DDR_RE.search(description)
         if ddr_match:
             specs["ram_type"] = ddr_match.group(1).upper()
 
@@ -6,14 +6,59 @@ This is the primary/universal data source since it aggregates
 results from all retailers.
 """
 
-import re
+import functools
+
 import requests
 import json
 
+try:
+    # orjson parses the response bytes directly, skipping the text decode
+    # the stdlib path does. Same graceful fallback as app.py.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from scrapers import make_product, identify_retailer
 from spec_parser import extract_specs, categorize_product
 
 
+# One pooled session per process: repeat searches reuse the TLS
+# connection to serpapi.com instead of handshaking every call, and
+# transient connection failures get a short retry.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.5),
+))
+
+
+# Delete-table for price strings ("$1,299.99" -> "1299.99"). str.translate
+# is a C-level table walk, much cheaper than the regex engine for plain
+# character stripping. The table covers latin-1 plus the euro sign, which
+# handles the common formats; anything it misses (e.g. the U+202F group
+# separator in fr-CA prices) takes the keep-only slow path below.
+_PRICE_TRANS = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(256)) if c not in '0123456789.') + '€')
+_PRICE_CHARS = frozenset('0123456789.')
+
+
+def _parse_price(price_str):
+    """Strip currency symbols/separators and parse the remaining number."""
+    try:
+        return float(price_str.translate(_PRICE_TRANS) or 0)
+    except ValueError:
+        pass
+    # Separators above U+00FF survived the table: keep digit/dot code
+    # points only, and never let one odd price string kill the search.
+    try:
+        return float(''.join(c for c in price_str if c in _PRICE_CHARS) or 0)
+    except ValueError:
+        return 0.0
+
+
 def search_products(query, category=None, api_key=None, max_results=40, country='ca'):
     """Search Google Shopping via SerpApi.
 
@@ -41,9 +86,9 @@ def search_products(query, category=None, api_key=None, max_results=40, country=
     }
 
     try:
-        response = requests.get("https://serpapi.com/search", params=params, timeout=30)
+        response = _SESSION.get("https://serpapi.com/search", params=params, timeout=30)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
 
         if "error" in data:
             return None, f"API Error: {data['error']}"
@@ -59,7 +104,7 @@ def search_products(query, category=None, api_key=None, max_results=40, country=
             # Parse price
             price_str = item.get("price", "$0")
             if isinstance(price_str, str):
-                price = float(re.sub(r'[^\d.]', '', price_str) or 0)
+                price = _parse_price(price_str)
             else:
                 price = float(price_str) if price_str else 0
 
@@ -67,7 +112,7 @@ def search_products(query, category=None, api_key=None, max_results=40, country=
             original_price = None
             old_price_str = item.get("old_price", "")
             if old_price_str:
-                original_price = float(re.sub(r'[^\d.]', '', old_price_str) or 0)
+                original_price = _parse_price(old_price_str)
                 if original_price <= price:
                     original_price = None
 
@@ -120,7 +165,13 @@ def build_search_query(base_query, min_specs=None):
     """Build an enhanced search query based on minimum spec requirements."""
     if not min_specs:
         return base_query
+    # Freeze the dict so repeat builds with the same specs hit the cache.
+    return _build_search_query_cached(base_query, tuple(sorted(min_specs.items())))
+
 
+@functools.lru_cache(maxsize=64)
+def _build_search_query_cached(base_query, specs_items):
+    min_specs = dict(specs_items)
     query_parts = [base_query]
 
     if min_specs.get('ram', 0) >= 32:
@@ -5,31 +5,215 @@ Extracted from app.py — provides spec extraction for laptops, desktops,
 RAM, CPUs, and other tech components.
 """
 
+import functools
 import re
 
+# Patterns are compiled once at import time. extract_specs & friends run
+# per-product over hundreds of products, so going through re's internal
+# pattern cache (a dict lookup keyed on the pattern string) on every call
+# adds up.
+_SIZE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([TG])B', re.IGNORECASE)
+_SIZE_MULT = {'T': 1024, 'G': 1}
+
+# The hot extract_specs patterns run against a single pre-lowercased
+# copy of the name instead of paying re.IGNORECASE case-folding on every
+# character of every scan. Display casing is recovered by slicing the
+# original name with the match spans where it matters.
+
+# Marketed RAM capacities; anything else is a false positive (VRAM,
+# storage, model numbers).
+_VALID_RAM_GB = frozenset((8, 12, 16, 24, 32, 48, 64, 96, 128))
+
+# Fallback RAM formats, tried in order as independent whole-string
+# searches. These can't be fused into one alternation: finditer is
+# non-overlapping, so a lower-priority branch's match would consume text
+# a higher-priority branch needed, and each pattern must get its own
+# first occurrence regardless of where the others matched.
+_RAM_FALLBACK_RES = [re.compile(p) for p in (
+    r'(\d+)\s{0,3}gb\s{0,3}(?:ddr\d?)?\s{0,3}ram',
+    r'(\d+)\s{0,3}gb\s{0,3}ddr\d',
+    r'[,/\s](\d+)\s{0,3}gb[,/\s]',
+    r'(\d+)gb(?:\s|,|/|-|$)',
+    r'[^\d](\d+)\s{0,3}gb\s{1,3}(?:memory|mem)',
+    r'-\s{0,3}(\d+)gb',
+)]
+
+# Fallback storage formats, same scheme. The bare-TB/GB patterns at the
+# end capture only the number; their unit is implied.
+_STORAGE_FALLBACK_RES = [re.compile(p) for p in (
+    r'(\d+(?:\.\d+)?)\s{0,3}(tb|gb)\s{0,3}ssd',
+    r'(\d+(?:\.\d+)?)\s{0,3}(tb|gb)\s{0,3}(?:nvme|pcie)',
+    r'ssd[:\s]{0,3}(\d+(?:\.\d+)?)\s{0,3}(tb|gb)',
+    r'(\d+(?:\.\d+)?)\s{0,3}(tb|gb)\s{0,3}(?:storage|hard|drive)',
+    r'[,/\s](\d+)\s{0,3}(tb)[,/\s]',
+    r'[,/\s](512|256|1024|2048)\s{0,3}gb[,/\s]',
+)]
+
+# Fused alternation covering the common CPU/RAM/storage/GPU formats.
+# extract_specs walks the name once with finditer and dispatches on which
+# named group matched instead of running eight independent full-string
+# searches. The fallback pattern lists above cover the rarer formats this
+# pass doesn't.
+_SPECS_RE = re.compile(
+    r'(?P<intel>(?P<intel_family>i\d)-(?:(?P<intel5>\d{5})|(?P<intel4>\d{4})))'
+    r'|(?P<ultra>(?:core\s{1,3})?ultra\s{0,3}(?P<ultra_num>\d+))'
+    r'|(?P<amd>ryzen\s{0,3}(?P<amd_series>\d)\s{0,3}(?P<amd_num>\d{4}))'
+    r'|(?P<snap>snapdragon\s{0,3}x(?:\s{0,3}(?P<snap_model>\w+))?)'
+    r'|(?P<ram_kw>(?P<ram_kw_gb>\d+)\s{0,3}gb\s{0,3}(?:ddr\d?\s{0,3})?ram)'
+    r'|(?P<ram_ddr>(?P<ram_ddr_gb>\d+)\s{0,3}gb\s{0,3}ddr\d)'
+    r'|(?P<ssd>(?P<ssd_num>\d+(?:\.\d+)?)\s{0,3}(?P<ssd_unit>tb|gb)\s{0,3}ssd)'
+    r'|(?P<nvme>(?P<nvme_num>\d+(?:\.\d+)?)\s{0,3}(?P<nvme_unit>tb|gb)\s{0,3}(?:nvme|pcie))'
+    r'|(?P<gpu>rtx\s{0,3}\d{4}(?:\s{0,3}ti)?|gtx\s{0,3}\d{4})'
+    r'|(?P<amd_gpu>rx\s{0,3}\d{4}(?:\s{0,3}xt)?)'
+)
+_SPECS_GROUPS = ('intel', 'ultra', 'amd', 'snap', 'ram_kw', 'ram_ddr',
+                 'ssd', 'nvme', 'gpu', 'amd_gpu')
+
+# The RAM and storage formats keep one named group per original pattern;
+# these tables replay the old pattern priority (keyword-RAM before bare
+# DDR, SSD before NVMe/PCIe) over the first hit of each branch, so the
+# highest-priority format wins, not the positionally first one.
+_RAM_ORDER = (('ram_kw', 'ram_kw_gb'), ('ram_ddr', 'ram_ddr_gb'))
+_STORAGE_ORDER = (('ssd', 'ssd_num', 'ssd_unit'), ('nvme', 'nvme_num', 'nvme_unit'))
+
+# Screen size (e.g., 15.6", 14", 17.3")
+_SCREEN_RES = [re.compile(p) for p in (
+    r'(\d{1,2}(?:\.\d)?)["”″]\s*(?:fhd|qhd|uhd|hd|oled|ips|led)?',
+    r'(\d{1,2}(?:\.\d)?)\s*(?:inch|in)\b',
+    r'(\d{1,2}(?:\.\d)?)\s*(?:fhd|qhd|uhd|hd|oled)',
+)]
+
+# Resolution (FHD, QHD, UHD/4K, HD, etc.) — one fused alternation scanned
+# once instead of 13 separate searches. Branch order resolves overlaps at a
+# single position (QHD+ before QHD, HD+ before HD); _RESOLUTION_RANKED keeps
+# the old more-specific-first priority across the whole string. OLED is a
+# fallback only when no pixel resolution is present.
+_RESOLUTION_RE = re.compile(
+    r'(?P<uhd>\b(?:4k|uhd|2160p)\b)'
+    r'|(?P<qhd_plus>\bqhd\+)'
+    r'|(?P<qhd>\b(?:qhd|1440p)\b)'
+    r'|(?P<wqxga>\bwqxga\b)'
+    r'|(?P<fhd_plus>\bfhd\+)'
+    r'|(?P<fhd>\b(?:fhd|1080p)\b)'
+    r'|(?P<hd_plus>\bhd\+)'
+    r'|(?P<hd>\bhd\b)'
+    r'|(?P<oled>\boled\b)'
+)
+_RESOLUTION_RANKED = (
+    ('uhd', '4K UHD'),
+    ('qhd_plus', 'QHD+'),
+    ('qhd', 'QHD'),
+    ('wqxga', 'WQXGA'),
+    ('fhd_plus', 'FHD+'),
+    ('fhd', 'FHD'),
+    ('hd_plus', 'HD+'),
+    ('hd', 'HD'),
+)
+
+# RAM stick parsing (extract_ram_specs)
+_KIT_RE = re.compile(r'(\d+)\s*x\s*(\d+)\s*GB', re.IGNORECASE)
+_CAPACITY_RE = re.compile(r'(\d+)\s*GB', re.IGNORECASE)
+_DDR_SPEED_RE = re.compile(r'(DDR[45])\s*[-:]?\s*(\d{4,5})', re.IGNORECASE)
+_DDR_TYPE_RE = re.compile(r'(DDR[45])', re.IGNORECASE)
+_CL_RE = re.compile(r'CL(\d+)', re.IGNORECASE)
+_VOLTAGE_RE = re.compile(r'(\d+\.\d+)\s*V\b', re.IGNORECASE)
+
+# CPU parsing (extract_cpu_specs)
+_CPU_INTEL_RE = re.compile(r'(i\d)-(\d{4,5}[A-Z]*)')
+_CPU_ULTRA_RE = re.compile(r'(?:Core\s+)?Ultra\s*(\d+)\s*(\w*)', re.IGNORECASE)
+_CPU_AMD_RE = re.compile(r'Ryzen\s*(\d)\s*(\d{4}\w*)', re.IGNORECASE)
+_DIGITS_RE = re.compile(r'\d+')
+_CORE_COUNT_RE = re.compile(r'(\d+)\s*-?\s*[Cc]ore')
+_CLOCK_RE = re.compile(r'(\d+(?:\.\d+)?)\s*GHz', re.IGNORECASE)
+_SOCKET_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'(AM[45])',
+    r'(LGA\s*\d{4})',
+    r'(Socket\s*\w+)',
+)]
+
+# GPU card parsing (extract_gpu_specs)
+_NVIDIA_CARD_RE = re.compile(r'((?:GeForce\s+)?(?:RTX|GTX)\s*\d{4}(?:\s*Ti)?(?:\s*(?:SUPER|Super))?)', re.IGNORECASE)
+_AMD_CARD_RE = re.compile(r'((?:Radeon\s+)?RX\s*\d{4}(?:\s*(?:XT|XTX))?)', re.IGNORECASE)
+_ARC_CARD_RE = re.compile(r'(Arc\s*A\d{3}\w?)', re.IGNORECASE)
+_VRAM_RE = re.compile(r'(\d+)\s*GB(?:\s*(?:GDDR|VRAM))?', re.IGNORECASE)
+
+
+# Default spec dicts, copied per call. Specs stay plain dicts — the app,
+# filters and DB layer all rely on .get() and on the shape varying by
+# category — but the per-call defaults don't need rebuilding key by key.
+_LAPTOP_SPECS_DEFAULTS = {
+    'cpu_gen': 0,
+    'cpu_model': 'Unknown',
+    'ram': 0,
+    'storage': 0,
+    'gpu': 'Integrated',
+    'screen_size': 0,
+    'resolution': 'Unknown',
+    'resolution_rank': 0,
+}
+
+_RAM_SPECS_DEFAULTS = {
+    'ram': 0,
+    'ram_type': 'Unknown',
+    'ram_speed_mhz': 0,
+    'kit_config': '',
+    'stick_count': 0,
+    'per_stick_gb': 0,
+    'cas_latency': 0,
+    'form_factor': 'Unknown',
+    'brand': '',
+    'voltage': 0,
+}
+
+_CPU_SPECS_DEFAULTS = {
+    'cpu_model': 'Unknown',
+    'cpu_gen': 0,
+    'core_count': 0,
+    'base_clock_ghz': 0,
+    'socket': '',
+}
+
+_GPU_SPECS_DEFAULTS = {
+    'gpu': 'Unknown',
+    'vram_gb': 0,
+}
+
 
 def parse_size(size_str):
-    """Parse storage/RAM strings like '16GB', '1TB', '512GB' into GB as integer."""
+    """Parse storage/RAM strings like '16GB', '1TB', '512GB' into GB as integer.
+
+    One anchored number+unit match and a multiplier lookup — the old
+    version uppercased/space-stripped the string and ran up to two
+    regex searches per call.
+    """
     if not size_str:
         return 0
-    size_str = str(size_str).upper().replace(" ", "")
-
+    match = _SIZE_RE.search(str(size_str))
+    if not match:
+        return 0
     try:
-        if "TB" in size_str:
-            match = re.search(r'(\d+(?:\.\d+)?)', size_str)
-            if match:
-                return int(float(match.group(1)) * 1024)
-        if "GB" in size_str:
-            match = re.search(r'(\d+(?:\.\d+)?)', size_str)
-            if match:
-                return int(float(match.group(1)))
-    except (ValueError, AttributeError):
-        pass
-    return 0
+        return int(float(match.group(1)) * _SIZE_MULT[match.group(2).upper()])
+    except ValueError:
+        return 0
 
 
+def _size_gb(num, unit):
+    """GB from already-matched (number, unit) regex groups.
+
+    The storage patterns capture the number and unit separately, so
+    there is no need to re-concatenate and re-parse through parse_size.
+    """
+    return int(float(num) * (1024 if unit[0] in 'tT' else 1))
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_condition(name):
-    """Extract product condition from name (New, Refurbished, Open Box)."""
+    """Extract product condition from name (New, Refurbished, Open Box).
+
+    Cached like _extract_specs_cached — the same names recur across
+    Streamlit reruns and repeat analyses. Returns are strings, so the
+    cached value can be shared directly.
+    """
     name_lower = name.lower()
 
     if 'refurbished' in name_lower:
@@ -54,7 +238,17 @@ def extract_specs(name, category='laptop'):
     For 'cpu': model, generation, core count.
     For 'gpu': model, VRAM.
     For other categories: returns basic specs dict.
+
+    Results are memoized per (name, category): listing pages repeat the
+    same product name across SKU/variant blocks, so duplicates skip the
+    regex cascade entirely. Callers get a copy so cached entries can't
+    be mutated.
     """
+    return _extract_specs_cached(name, category).copy()
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_specs_cached(name, category):
     if category == 'ram':
         return extract_ram_specs(name)
     elif category == 'cpu':
@@ -63,128 +257,122 @@ def extract_specs(name, category='laptop'):
         return extract_gpu_specs(name)
 
     # Default: laptop/desktop spec extraction
-    specs = {
-        'cpu_gen': 0,
-        'cpu_model': 'Unknown',
-        'ram': 0,
-        'storage': 0,
-        'gpu': 'Integrated',
-        'screen_size': 0,
-        'resolution': 'Unknown'
-    }
+    specs = _LAPTOP_SPECS_DEFAULTS.copy()
+
+    # Single fused pass over one lowercased copy: collect the first hit
+    # per category, then apply them below in the same precedence order
+    # the old sequential searches used (Intel < Ultra < AMD < Snapdragon
+    # overwrite; NVIDIA before RX).
+    name_lower = name.lower()
+    hits = {}
+    for m in _SPECS_RE.finditer(name_lower):
+        for group in _SPECS_GROUPS:
+            if group not in hits and m.group(group) is not None:
+                hits[group] = m
+                break
+        if len(hits) == len(_SPECS_GROUPS):
+            break
 
     # Intel Core iX-XXXXX (e.g., i7-13620H, i5-12450H)
-    intel_match = re.search(r'(i\d)-(\d{4,5})', name)
+    intel_match = hits.get('intel')
     if intel_match:
-        specs['cpu_model'] = f"{intel_match.group(1)}-{intel_match.group(2)}"
-        model_num = intel_match.group(2)
-        if len(model_num) == 5:
+        # The 5- and 4-digit SKUs match separate branches, so which group
+        # filled in tells us the generation width without a length check.
+        model_num = intel_match.group('intel5')
+        if model_num:
             specs['cpu_gen'] = int(model_num[:2])
-        elif len(model_num) == 4:
+        else:
+            model_num = intel_match.group('intel4')
             specs['cpu_gen'] = int(model_num[0])
+        specs['cpu_model'] = f"{intel_match.group('intel_family')}-{model_num}"
 
     # Intel Core Ultra (newer chips, treat as gen 14+)
-    ultra_match = re.search(r'(?:Core\s+)?Ultra\s*(\d+)', name, re.IGNORECASE)
+    ultra_match = hits.get('ultra')
     if ultra_match:
         specs['cpu_gen'] = 14
-        specs['cpu_model'] = f"Ultra {ultra_match.group(1)}"
+        specs['cpu_model'] = f"Ultra {ultra_match.group('ultra_num')}"
 
     # AMD Ryzen (e.g., Ryzen 7 7840HS)
-    amd_match = re.search(r'Ryzen\s*(\d)\s*(\d{4})', name, re.IGNORECASE)
+    amd_match = hits.get('amd')
     if amd_match:
-        specs['cpu_model'] = f"Ryzen {amd_match.group(1)} {amd_match.group(2)}"
-        series = int(amd_match.group(2)[0])
+        specs['cpu_model'] = f"Ryzen {amd_match.group('amd_series')} {amd_match.group('amd_num')}"
+        series = int(amd_match.group('amd_num')[0])
         specs['cpu_gen'] = series + 6
 
     # Qualcomm Snapdragon X
-    if re.search(r'Snapdragon\s*X', name, re.IGNORECASE):
+    snap_match = hits.get('snap')
+    if snap_match:
         specs['cpu_gen'] = 14
-        snap_match = re.search(r'Snapdragon\s*X\s*(\w+)', name, re.IGNORECASE)
-        if snap_match:
-            specs['cpu_model'] = f"Snapdragon X {snap_match.group(1)}"
-
-    # RAM - multiple patterns to catch various formats
-    ram_patterns = [
-        r'(\d+)\s*GB\s*(?:DDR\d?)?\s*RAM',
-        r'(\d+)\s*GB\s*DDR\d',
-        r'[,/\s](\d+)\s*GB[,/\s]',
-        r'(\d+)GB(?:\s|,|/|-|$)',
-        r'[^\d](\d+)\s*GB\s+(?:Memory|Mem)',
-        r'-\s*(\d+)GB',
-    ]
-    for pattern in ram_patterns:
-        ram_match = re.search(pattern, name, re.IGNORECASE)
+        if snap_match.group('snap_model'):
+            # Slice the original name so the model keeps its casing
+            model = name[snap_match.start('snap_model'):snap_match.end('snap_model')]
+            specs['cpu_model'] = f"Snapdragon X {model}"
+
+    # RAM — replay the old pattern priority, with an invalid value
+    # falling through to the next branch like the sequential code did
+    ram_found = False
+    for group, gb_group in _RAM_ORDER:
+        ram_match = hits.get(group)
         if ram_match:
-            ram_val = int(ram_match.group(1))
-            if ram_val in [8, 12, 16, 24, 32, 48, 64, 96, 128]:
+            ram_val = int(ram_match.group(gb_group))
+            if ram_val in _VALID_RAM_GB:
                 specs['ram'] = ram_val
+                ram_found = True
                 break
-
-    # Storage - multiple patterns for SSD/storage
-    storage_patterns = [
-        r'(\d+(?:\.\d+)?)\s*(TB|GB)\s*SSD',
-        r'(\d+(?:\.\d+)?)\s*(TB|GB)\s*(?:NVMe|PCIe)',
-        r'SSD[:\s]*(\d+(?:\.\d+)?)\s*(TB|GB)',
-        r'(\d+(?:\.\d+)?)\s*(TB|GB)\s*(?:Storage|Hard|Drive)',
-        r'[,/\s](\d+)\s*(TB)[,/\s]',
-        r'[,/\s](512|256|1024|2048)\s*GB[,/\s]',
-    ]
-    for pattern in storage_patterns:
-        storage_match = re.search(pattern, name, re.IGNORECASE)
+    if not ram_found:
+        # Rarer formats not covered by the fused pass
+        for pattern in _RAM_FALLBACK_RES:
+            ram_match = pattern.search(name_lower)
+            if ram_match:
+                ram_val = int(ram_match.group(1))
+                if ram_val in _VALID_RAM_GB:
+                    specs['ram'] = ram_val
+                    break
+
+    storage_match = None
+    for group, num_group, unit_group in _STORAGE_ORDER:
+        storage_match = hits.get(group)
         if storage_match:
-            if len(storage_match.groups()) >= 2:
-                specs['storage'] = parse_size(f"{storage_match.group(1)}{storage_match.group(2)}")
-            else:
-                specs['storage'] = parse_size(f"{storage_match.group(1)}GB")
+            specs['storage'] = _size_gb(storage_match.group(num_group), storage_match.group(unit_group))
             break
+    if storage_match is None:
+        for pattern in _STORAGE_FALLBACK_RES:
+            storage_match = pattern.search(name_lower)
+            if storage_match:
+                if len(storage_match.groups()) >= 2:
+                    specs['storage'] = _size_gb(storage_match.group(1), storage_match.group(2))
+                else:
+                    specs['storage'] = _size_gb(storage_match.group(1), 'gb')
+                break
 
-    # GPU
-    gpu_match = re.search(r'(RTX\s*\d{4}(?:\s*Ti)?|GTX\s*\d{4})', name, re.IGNORECASE)
+    # GPU (NVIDIA takes precedence over AMD RX)
+    gpu_match = hits.get('gpu')
     if gpu_match:
-        specs['gpu'] = gpu_match.group(1).upper().replace("  ", " ")
+        specs['gpu'] = gpu_match.group('gpu').upper().replace("  ", " ")
 
-    # AMD GPU
-    amd_gpu_match = re.search(r'(RX\s*\d{4}(?:\s*XT)?)', name, re.IGNORECASE)
+    amd_gpu_match = hits.get('amd_gpu')
     if amd_gpu_match and specs['gpu'] == 'Integrated':
-        specs['gpu'] = amd_gpu_match.group(1).upper().replace("  ", " ")
-
-    # Screen size (e.g., 15.6", 14", 17.3")
-    screen_patterns = [
-        r'(\d{1,2}(?:\.\d)?)["\u201d\u2033]\s*(?:FHD|QHD|UHD|HD|OLED|IPS|LED)?',
-        r'(\d{1,2}(?:\.\d)?)\s*(?:inch|in)\b',
-        r'(\d{1,2}(?:\.\d)?)\s*(?:FHD|QHD|UHD|HD|OLED)',
-    ]
-    for pattern in screen_patterns:
-        screen_match = re.search(pattern, name, re.IGNORECASE)
+        specs['gpu'] = amd_gpu_match.group('amd_gpu').upper().replace("  ", " ")
+
+    for pattern in _SCREEN_RES:
+        screen_match = pattern.search(name_lower)
         if screen_match:
             size = float(screen_match.group(1))
             if 10 <= size <= 40:  # Valid screen sizes (up to 40 for desktops/monitors)
                 specs['screen_size'] = size
                 break
 
-    # Resolution (FHD, QHD, UHD/4K, HD, etc.)
-    resolution_map = {
-        r'\b4K\b': '4K UHD',
-        r'\bUHD\b': '4K UHD',
-        r'\bQHD\+': 'QHD+',
-        r'\bQHD\b': 'QHD',
-        r'\bWQXGA\b': 'WQXGA',
-        r'\bFHD\+': 'FHD+',
-        r'\bFHD\b': 'FHD',
-        r'\b1080p\b': 'FHD',
-        r'\b1440p\b': 'QHD',
-        r'\b2160p\b': '4K UHD',
-        r'\bHD\+': 'HD+',
-        r'\bHD\b': 'HD',
-        r'\bOLED\b': 'OLED',
-    }
-    for pattern, resolution in resolution_map.items():
-        if re.search(pattern, name, re.IGNORECASE):
-            if resolution == 'OLED':
-                specs['resolution'] = 'OLED'
-                continue
-            specs['resolution'] = resolution
-            break
+    res_hits = {m.lastgroup for m in _RESOLUTION_RE.finditer(name_lower)}
+    if res_hits:
+        for group, resolution in _RESOLUTION_RANKED:
+            if group in res_hits:
+                specs['resolution'] = resolution
+                break
+        else:
+            specs['resolution'] = 'OLED'
+        # Precompute the sort rank so hot scoring loops read a plain int
+        # instead of re-doing the dict lookup per product.
+        specs['resolution_rank'] = RESOLUTION_RANK[specs['resolution']]
 
     return specs
 
@@ -205,21 +393,10 @@ def extract_ram_specs(name):
     - "G.Skill Ripjaws V 16GB (2x8GB) DDR4-3200 CL16"
     - "Crucial 32GB DDR4-3200 SODIMM CT32G4SFD832A"
     """
-    specs = {
-        'ram': 0,
-        'ram_type': 'Unknown',
-        'ram_speed_mhz': 0,
-        'kit_config': '',
-        'stick_count': 0,
-        'per_stick_gb': 0,
-        'cas_latency': 0,
-        'form_factor': 'Unknown',
-        'brand': '',
-        'voltage': 0,
-    }
+    specs = _RAM_SPECS_DEFAULTS.copy()
 
     # Kit configuration first (2x16GB, 4x8GB, etc.) — this gives us the most accurate total
-    kit_match = re.search(r'(\d+)\s*x\s*(\d+)\s*GB', name, re.IGNORECASE)
+    kit_match = _KIT_RE.search(name)
     if kit_match:
         stick_count = int(kit_match.group(1))
         per_stick = int(kit_match.group(2))
@@ -229,24 +406,24 @@ def extract_ram_specs(name):
         specs['ram'] = stick_count * per_stick  # Total capacity from kit
     else:
         # No kit config — look for total capacity
-        cap_match = re.search(r'(\d+)\s*GB', name, re.IGNORECASE)
+        cap_match = _CAPACITY_RE.search(name)
         if cap_match:
             specs['ram'] = int(cap_match.group(1))
             specs['stick_count'] = 1
             specs['per_stick_gb'] = specs['ram']
 
     # DDR type and speed
-    ddr_match = re.search(r'(DDR[45])\s*[-:]?\s*(\d{4,5})', name, re.IGNORECASE)
+    ddr_match = _DDR_SPEED_RE.search(name)
     if ddr_match:
         specs['ram_type'] = ddr_match.group(1).upper()
         specs['ram_speed_mhz'] = int(ddr_match.group(2))
     else:
-        ddr_type_match = re.search(r'(DDR[45])', name, re.IGNORECASE)
+        ddr_type_match = _DDR_TYPE_RE.search(name)
         if ddr_type_match:
             specs['ram_type'] = ddr_type_match.group(1).upper()
 
     # CAS latency
-    cl_match = re.search(r'CL(\d+)', name, re.IGNORECASE)
+    cl_match = _CL_RE.search(name)
     if cl_match:
         specs['cas_latency'] = int(cl_match.group(1))
 
@@ -276,7 +453,7 @@ def extract_ram_specs(name):
             break
 
     # Voltage (e.g., 1.35V, 1.25V, 1.1V)
-    volt_match = re.search(r'(\d+\.\d+)\s*V\b', name, re.IGNORECASE)
+    volt_match = _VOLTAGE_RE.search(name)
     if volt_match:
         v = float(volt_match.group(1))
         if 0.9 <= v <= 1.6:  # Valid RAM voltage range
@@ -292,55 +469,44 @@ def extract_cpu_specs(name):
     - "AMD Ryzen 7 7800X3D 8-Core 4.2GHz AM5"
     - "Intel Core i7-14700K 20-Core LGA 1700"
     """
-    specs = {
-        'cpu_model': 'Unknown',
-        'cpu_gen': 0,
-        'core_count': 0,
-        'base_clock_ghz': 0,
-        'socket': '',
-    }
+    specs = _CPU_SPECS_DEFAULTS.copy()
 
     # Intel
-    intel_match = re.search(r'(i\d)-(\d{4,5}[A-Z]*)', name)
+    intel_match = _CPU_INTEL_RE.search(name)
     if intel_match:
         specs['cpu_model'] = f"{intel_match.group(1)}-{intel_match.group(2)}"
-        model_num = re.search(r'\d+', intel_match.group(2)).group()
+        model_num = _DIGITS_RE.search(intel_match.group(2)).group()
         if len(model_num) == 5:
             specs['cpu_gen'] = int(model_num[:2])
         elif len(model_num) == 4:
             specs['cpu_gen'] = int(model_num[0])
 
     # Intel Core Ultra
-    ultra_match = re.search(r'(?:Core\s+)?Ultra\s*(\d+)\s*(\w*)', name, re.IGNORECASE)
+    ultra_match = _CPU_ULTRA_RE.search(name)
     if ultra_match:
         specs['cpu_gen'] = 14
         specs['cpu_model'] = f"Ultra {ultra_match.group(1)}"
 
     # AMD Ryzen
-    amd_match = re.search(r'Ryzen\s*(\d)\s*(\d{4}\w*)', name, re.IGNORECASE)
+    amd_match = _CPU_AMD_RE.search(name)
     if amd_match:
         specs['cpu_model'] = f"Ryzen {amd_match.group(1)} {amd_match.group(2)}"
         series = int(amd_match.group(2)[0])
         specs['cpu_gen'] = series + 6
 
     # Core count
-    core_match = re.search(r'(\d+)\s*-?\s*[Cc]ore', name)
+    core_match = _CORE_COUNT_RE.search(name)
     if core_match:
         specs['core_count'] = int(core_match.group(1))
 
     # Base clock
-    clock_match = re.search(r'(\d+(?:\.\d+)?)\s*GHz', name, re.IGNORECASE)
+    clock_match = _CLOCK_RE.search(name)
     if clock_match:
         specs['base_clock_ghz'] = float(clock_match.group(1))
 
     # Socket
-    socket_patterns = [
-        r'(AM[45])',
-        r'(LGA\s*\d{4})',
-        r'(Socket\s*\w+)',
-    ]
-    for pattern in socket_patterns:
-        socket_match = re.search(pattern, name, re.IGNORECASE)
+    for pattern in _SOCKET_RES:
+        socket_match = pattern.search(name)
         if socket_match:
             specs['socket'] = socket_match.group(1).strip()
             break
@@ -355,28 +521,25 @@ def extract_gpu_specs(name):
     - "ASUS TUF Gaming GeForce RTX 4070 Ti SUPER 16GB OC"
     - "MSI Gaming X Trio Radeon RX 7900 XTX 24GB"
     """
-    specs = {
-        'gpu': 'Unknown',
-        'vram_gb': 0,
-    }
+    specs = _GPU_SPECS_DEFAULTS.copy()
 
     # NVIDIA
-    nvidia_match = re.search(r'((?:GeForce\s+)?(?:RTX|GTX)\s*\d{4}(?:\s*Ti)?(?:\s*(?:SUPER|Super))?)', name, re.IGNORECASE)
+    nvidia_match = _NVIDIA_CARD_RE.search(name)
     if nvidia_match:
         specs['gpu'] = nvidia_match.group(1).strip()
 
     # AMD
-    amd_match = re.search(r'((?:Radeon\s+)?RX\s*\d{4}(?:\s*(?:XT|XTX))?)', name, re.IGNORECASE)
+    amd_match = _AMD_CARD_RE.search(name)
     if amd_match and specs['gpu'] == 'Unknown':
         specs['gpu'] = amd_match.group(1).strip()
 
     # Intel Arc
-    arc_match = re.search(r'(Arc\s*A\d{3}\w?)', name, re.IGNORECASE)
+    arc_match = _ARC_CARD_RE.search(name)
     if arc_match and specs['gpu'] == 'Unknown':
         specs['gpu'] = arc_match.group(1).strip()
 
     # VRAM
-    vram_match = re.search(r'(\d+)\s*GB(?:\s*(?:GDDR|VRAM))?', name, re.IGNORECASE)
+    vram_match = _VRAM_RE.search(name)
     if vram_match:
         vram = int(vram_match.group(1))
         if vram in [2, 3, 4, 6, 8, 10, 12, 16, 24, 48]: